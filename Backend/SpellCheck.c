@@ -4,36 +4,33 @@
 #include <ctype.h> // For tolower
 #include <stdbool.h> // For bool type (though using int for ctypes compatibility)
 #include <math.h> // For abs and fmin
+#include "SpellCheck.h" // Public API shared with the Python bindings
 
 // Defines
-#define MAX_WORD_LEN 50
 #define MAX_LINE_LEN 256
 #define DICTIONARY_SIZE 375000 // Approximate size, adjust if your dictionary is much larger
-#define MAX_TEMP_SUGGESTIONS 1000 // This MUST match MAX_TEMP_SUGGESTIONS_C in Python!
+
+// Debug output on the spell check paths, compile with -DSPELLCHECK_DEBUG to enable
+#ifdef SPELLCHECK_DEBUG
+#define DEBUG_PRINT(...) printf(__VA_ARGS__)
+#else
+#define DEBUG_PRINT(...) ((void)0)
+#endif
 
 // Struct to store dictionary words
 typedef struct {
     char word[MAX_WORD_LEN];
 } DictionaryWord;
 
-// Struct for suggestions
-typedef struct {
-    char word[MAX_WORD_LEN];
-    int dist; // Levenshtein distance
-} Suggestion;
-
 // Global dictionary (for simplicity, but can be passed around)
 DictionaryWord* dictionary = NULL;
 int dictionary_count = 0;
 int dictionary_capacity = 0;
 
-// Function Prototypes
+// Function Prototypes (the public ones are declared in SpellCheck.h)
 int damerau_levenshtein_distance(const char *s1, const char *s2);
-int load_dictionary(const char* filename);
-int is_word_correct(const char* word);
-int get_suggestions(const char* word, int tolerance, int misspelled_word_len, int length_tolerance, Suggestion* suggestions);
+int damerau_levenshtein_distance_bounded(const char *s1, const char *s2, int max_dist);
 void sort_suggestions(Suggestion *suggestions, int count);
-void cleanup();
 
 
 // Function to calculate Damerau-Levenshtein distance (replaces previous levenshtein_distance)
@@ -100,6 +97,65 @@ int damerau_levenshtein_distance(const char *s1, const char *s2) {
     return result;
 }
 
+// Bounded Damerau-Levenshtein distance for the suggestion search
+// Only fills a diagonal band of width 2*max_dist+1 and stops as soon as a whole row exceeds max_dist.
+// Returns the distance if it is <= max_dist, otherwise max_dist + 1
+int damerau_levenshtein_distance_bounded(const char *s1, const char *s2, int max_dist) {
+    int len1 = strlen(s1);
+    int len2 = strlen(s2);
+    int over = max_dist + 1;
+
+    if (abs(len1 - len2) > max_dist) return over; // Length difference alone is too large
+    if (len1 == 0) return len2;
+    if (len2 == 0) return len1;
+    if (len1 >= MAX_WORD_LEN || len2 >= MAX_WORD_LEN) {
+        // Longer than the row buffers, fall back to the full matrix
+        int dist = damerau_levenshtein_distance(s1, s2);
+        return (dist >= 0 && dist <= max_dist) ? dist : over;
+    }
+
+    // Three rolling rows (i-2, i-1, i), the transposition needs the row two back
+    int rows[3][MAX_WORD_LEN + 1];
+    int *prev2 = rows[0], *prev = rows[1], *curr = rows[2];
+
+    for (int j = 0; j <= len2; j++) {
+        prev[j] = (j < over) ? j : over;
+    }
+
+    for (int i = 1; i <= len1; i++) {
+        int lo = (i - max_dist > 1) ? i - max_dist : 1;
+        int hi = (i + max_dist < len2) ? i + max_dist : len2;
+        int row_min = over;
+
+        curr[0] = (i < over) ? i : over;
+        if (lo > 1) curr[lo - 1] = over; // Left edge of the band
+
+        for (int j = lo; j <= hi; j++) {
+            int cost = (s1[i - 1] == s2[j - 1]) ? 0 : 1;
+            int value = prev[j - 1] + cost;                        // Substitution or Match
+            if (prev[j] + 1 < value) value = prev[j] + 1;          // Deletion
+            if (curr[j - 1] + 1 < value) value = curr[j - 1] + 1;  // Insertion
+            if (i > 1 && j > 1 && s1[i - 1] == s2[j - 2] && s1[i - 2] == s2[j - 1] &&
+                prev2[j - 2] + 1 < value) {
+                value = prev2[j - 2] + 1; // Adjacent transposition
+            }
+            if (value > over) value = over;
+            curr[j] = value;
+            if (value < row_min) row_min = value;
+        }
+        if (hi < len2) curr[hi + 1] = over; // Right edge of the band, read by the next row
+
+        if (row_min > max_dist) return over; // Every later row can only be worse
+
+        int *temp = prev2;
+        prev2 = prev;
+        prev = curr;
+        curr = temp;
+    }
+
+    return (prev[len2] <= max_dist) ? prev[len2] : over;
+}
+
 // Function to load dictionary from a file
 // Returns 1 on success, 0 on failure
 int load_dictionary(const char* filename) {
@@ -161,7 +217,7 @@ int load_dictionary(const char* filename) {
 
     fclose(file);
     // --- DEBUG PRINT: Total words loaded ---
-    printf("Dict load finished. Total words: %d\n", dictionary_count);
+    DEBUG_PRINT("Dict load finished. Total words: %d\n", dictionary_count);
     return 1; // Success
 }
 
@@ -169,7 +225,7 @@ int load_dictionary(const char* filename) {
 // Returns 1 if correct, 0 if incorrect
 int is_word_correct(const char* word) {
     if (dictionary == NULL || dictionary_count == 0) {
-        printf("is_word_correct: Dictionary not loaded or empty.\n");
+        DEBUG_PRINT("is_word_correct: Dictionary not loaded or empty.\n");
         return 0; // No dictionary loaded
     }
 
@@ -180,26 +236,37 @@ int is_word_correct(const char* word) {
         lower_word[i] = tolower((unsigned char)lower_word[i]);
     }
     // --- DEBUG PRINT: Word received from Python ---
-    printf("is_word_correct: Checking input word '%s' (len=%lu)\n", lower_word, strlen(lower_word));
+    DEBUG_PRINT("is_word_correct: Checking input word '%s' (len=%lu)\n", lower_word, strlen(lower_word));
 
     for (int i = 0; i < dictionary_count; i++) {
         if (strcmp(lower_word, dictionary[i].word) == 0) {
             // --- DEBUG PRINT: Match found ---
-            printf("is_word_correct: MATCH FOUND for '%s' with dict word '%s'!\n", lower_word, dictionary[i].word);
+            DEBUG_PRINT("is_word_correct: MATCH FOUND for '%s' with dict word '%s'!\n", lower_word, dictionary[i].word);
             return 1; // Word found in dictionary
         }
     }
     // --- DEBUG PRINT: No match found ---
-    printf("is_word_correct: NO MATCH found for '%s'.\n", lower_word);
+    DEBUG_PRINT("is_word_correct: NO MATCH found for '%s'.\n", lower_word);
     return 0; // Word not found
 }
 
+// Function to check several words in one call
+// 'words' holds 'count' null-separated words; flags[i] is set to 1 if word i is correct, 0 otherwise
+// Returns the number of words checked
+int check_words_bulk(const char* words, int count, int* flags) {
+    const char* current = words;
+    for (int i = 0; i < count; i++) {
+        flags[i] = is_word_correct(current);
+        current += strlen(current) + 1; // Skip past the separator to the next word
+    }
+    return count;
+}
 
 // Function to get spelling suggestions
 // Fills the suggestions array and returns the number of suggestions found
 int get_suggestions(const char* word, int tolerance, int misspelled_word_len, int length_tolerance, Suggestion* suggestions) {
     if (dictionary == NULL || dictionary_count == 0) {
-        printf("get_suggestions: Dictionary not loaded or empty.\n");
+        DEBUG_PRINT("get_suggestions: Dictionary not loaded or empty.\n");
         return 0; // No dictionary loaded
     }
 
@@ -209,7 +276,7 @@ int get_suggestions(const char* word, int tolerance, int misspelled_word_len, in
     for (int i = 0; lower_word[i]; i++) {
         lower_word[i] = tolower((unsigned char)lower_word[i]);
     }
-    printf("get_suggestions: For input word '%s' (len=%lu)\n", lower_word, strlen(lower_word));
+    DEBUG_PRINT("get_suggestions: For input word '%s' (len=%lu)\n", lower_word, strlen(lower_word));
 
 
     int suggestion_count = 0;
@@ -228,10 +295,10 @@ int get_suggestions(const char* word, int tolerance, int misspelled_word_len, in
             continue; // Skip this dictionary word if its length difference is too high
         }
 
-        int dist = damerau_levenshtein_distance(lower_word, dict_word);
+        int dist = damerau_levenshtein_distance_bounded(lower_word, dict_word, tolerance);
         
-        // --- VERBOSE DEBUG PRINT: SHOW DISTANCE FOR EACH WORD (THIS LINE IS UNCOMMENTED) ---
-        printf("DEBUG_SUGG: Input '%s' (len=%lu) vs Dict '%s' (len=%lu) -> Dist: %d\n",
+        // --- VERBOSE DEBUG PRINT: SHOW DISTANCE FOR EACH WORD (SPELLCHECK_DEBUG BUILDS ONLY) ---
+        DEBUG_PRINT("DEBUG_SUGG: Input '%s' (len=%lu) vs Dict '%s' (len=%lu) -> Dist: %d\n",
                lower_word, strlen(lower_word), dict_word, strlen(dict_word), dist);
         // --- END VERBOSE DEBUG PRINT ---
 
@@ -252,7 +319,7 @@ int get_suggestions(const char* word, int tolerance, int misspelled_word_len, in
     // Call the sorting function to order suggestions by distance
     sort_suggestions(suggestions, suggestion_count);
 
-    printf("get_suggestions: Found %d suggestions.\n", suggestion_count);
+    DEBUG_PRINT("get_suggestions: Found %d suggestions.\n", suggestion_count);
     return suggestion_count;
 }
 
@@ -279,11 +346,13 @@ void cleanup() {
     }
     dictionary_count = 0;
     dictionary_capacity = 0;
-    printf("C cleanup: Dictionary memory freed.\n"); // Debug print for cleanup
+    DEBUG_PRINT("C cleanup: Dictionary memory freed.\n"); // Debug print for cleanup
 }
 
 
 
+// Standalone test, left out when the file is compiled into the Cython extension
+#ifndef SPELLCHECK_NO_MAIN
 int main() {
     const char* dict_file = "hi.txt"; // Make sure this file exists
     printf("Loading dictionary from: %s\n", dict_file);
@@ -313,3 +382,4 @@ int main() {
     
     return 0;
 }
+#endif
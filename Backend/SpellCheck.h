@@ -0,0 +1,21 @@
+#ifndef SPELLCHECK_H
+#define SPELLCHECK_H
+
+// Defines
+#define MAX_WORD_LEN 50
+#define MAX_TEMP_SUGGESTIONS 1000 // This MUST match MAX_TEMP_SUGGESTIONS_C in Python!
+
+// Struct for suggestions
+typedef struct {
+    char word[MAX_WORD_LEN];
+    int dist; // Levenshtein distance
+} Suggestion;
+
+// Functions used by the Python GUI (through ctypes or the Cython extension)
+int load_dictionary(const char* filename);
+int is_word_correct(const char* word);
+int check_words_bulk(const char* words, int count, int* flags);
+int get_suggestions(const char* word, int tolerance, int misspelled_word_len, int length_tolerance, Suggestion* suggestions);
+void cleanup();
+
+#endif // SPELLCHECK_H
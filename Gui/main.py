@@ -1,86 +1,371 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, scrolledtext, ttk
 from ctypes import CDLL, Structure, c_char_p, c_int, byref, POINTER, c_char
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import functools
+import logging
 import os
+import queue
 import re
+import threading
+
+try:
+    # Optional Cython build of the backend, see setup.py
+    import spellcheckfunc_cy
+except ImportError:
+    spellcheckfunc_cy = None
+
+log = logging.getLogger(__name__)
+
+# Words, punctuation runs and whitespace runs, in document order
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]+|\s+")
+
+
+def _changed_span(old, new):
+    """Return (start, old_end, new_end) bounding the items that differ between two sequences"""
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+def _tk_len(s):
+    """Length of s in Tk text index units"""
+    # Tcl 8.6 counts in UTF-16 code units, so characters outside the BMP count as two
+    if s.isascii() or tk.TclVersion >= 9.0:
+        return len(s)
+    return len(s.encode('utf-16-le')) // 2
+
+
+def _advance(pos, text):
+    """Return the Tk (line, column) reached by moving past text from pos"""
+    line, col = pos
+    newlines = text.count("\n")
+    if newlines:
+        return line + newlines, _tk_len(text[text.rfind("\n") + 1:])
+    return line, col + _tk_len(text)
+
+
+def _error_spans(pos, tokens, errors):
+    """Return the (line, start column, end column) of each misspelled token from pos, and the end position"""
+    spans = []
+    for token, is_error in zip(tokens, errors):
+        end = _advance(pos, token)
+        if is_error:
+            # Misspelled tokens are words, so they never span a newline
+            spans.append((pos[0], pos[1], end[1]))
+        pos = end
+    return spans, pos
 
 # --- CTYPES WRAPPER FOR C LIBRARY ---
 
+MAX_TEMP_SUGGESTIONS_C = 1000  # Must match MAX_TEMP_SUGGESTIONS in SpellCheck.h
+MAX_SHOWN_SUGGESTIONS = 5
+DEFAULT_TOLERANCE = 2
+SHORT_WORD_LEN = 4  # Words this short default to suggestions within 1 edit
+SHARD_MIN_WORDS = 512  # Bulk checks at least this big are split across threads
+
 class Suggestion(Structure):
     _fields_ = [("word", c_char * 50),
                 ("dist", c_int)]
 
+@functools.lru_cache(maxsize=None)
+def _load_library(library_path):
+    """dlopen the C library and declare its signatures, once per path for the whole process"""
+    lib = CDLL(library_path)
+
+    lib.load_dictionary.argtypes = [c_char_p]
+    lib.load_dictionary.restype = c_int
+
+    lib.is_word_correct.argtypes = [c_char_p]
+    lib.is_word_correct.restype = c_int
+
+    lib.check_words_bulk.argtypes = [c_char_p, c_int, POINTER(c_int)]
+    lib.check_words_bulk.restype = c_int
+
+    lib.get_suggestions.argtypes = [c_char_p, c_int, c_int, c_int, POINTER(Suggestion)]
+    lib.get_suggestions.restype = c_int
+
+    lib.cleanup.argtypes = []
+    lib.cleanup.restype = None
+    return lib
+
+class _SharedLock:
+    """Lock held either by any number of shared holders or by one exclusive holder"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._deferred = None
+
+    @contextlib.contextmanager
+    def shared(self):
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._shared += 1
+        try:
+            yield
+        finally:
+            self._release(exclusive=False)
+
+    @contextlib.contextmanager
+    def exclusive(self):
+        with self._cond:
+            while self._exclusive or self._shared:
+                self._cond.wait()
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            self._release(exclusive=True)
+
+    def run_exclusive_deferred(self, func):
+        """Run func holding the lock exclusively, now if it is free or else once its holders finish"""
+        with self._cond:
+            if self._exclusive or self._shared:
+                self._deferred = func
+                return
+            self._exclusive = True
+        self._run_deferred(func)
+
+    def _run_deferred(self, func):
+        try:
+            func()
+        finally:
+            self._release(exclusive=True)
+
+    def _release(self, exclusive):
+        deferred = None
+        with self._cond:
+            if exclusive:
+                self._exclusive = False
+            else:
+                self._shared -= 1
+            if self._deferred is not None and not self._shared and not self._exclusive:
+                deferred, self._deferred = self._deferred, None
+                self._exclusive = True
+            self._cond.notify_all()
+        if deferred is not None:
+            self._run_deferred(deferred)
+
 class CSpellChecker:
     def __init__(self, library_path):
         self.lib = None
         self.loaded = False
+        # Bumped on every dictionary load so callers can drop results from an older one
+        self.generation = 0
+        self._correct_cache = {}
+        self._suggestions_cache = {}
+        # Reused buffers for the ctypes calls. A call that finds one busy (another thread
+        # is mid-call) uses a temporary one instead, so lookups never queue on each other
+        self._bulk_flags = (c_int * 0)()
+        self._bulk_lock = threading.Lock()
+        # C may fill up to MAX_TEMP_SUGGESTIONS_C entries
+        self._sug_buf = (Suggestion * MAX_TEMP_SUGGESTIONS_C)()
+        self._sug_lock = threading.Lock()
+        # Calls come from both the Tk thread and the check worker. Lookups only read the
+        # dictionary in C so they share the lock, loading and cleanup take it exclusively
+        self._lock = _SharedLock()
+        # Lookups run without the GIL, so big batches can use several cores
+        self._shard_workers = os.cpu_count() or 1
+        self._shard_pool = None
+        if self._shard_workers > 1:
+            self._shard_pool = ThreadPoolExecutor(max_workers=self._shard_workers)
+        # The Cython extension bundles its own copy of the backend, no shared library needed
+        self._fast = spellcheckfunc_cy is not None
 
-        print(f"Attempting to load C library from: {library_path}")
+        if self._fast:
+            log.debug("Using the Cython spell checker extension.")
+            self.lib = spellcheckfunc_cy
+            return
+
+        log.debug("Attempting to load C library from: %s", library_path)
         try:
-            self.lib = CDLL(library_path)
-            print("C library loaded successfully.")
+            self.lib = _load_library(library_path)
+            log.debug("C library loaded successfully.")
         except OSError as e:
             messagebox.showerror("Library Load Error", f"Could not load C library: {e}\n"
                                                       f"Please ensure '{os.path.basename(library_path)}' "
                                                        "is compiled correctly for your OS and architecture "
                                                        "and is in the same directory as gui.py.")
-            return
-
-        self.lib.load_dictionary.argtypes = [c_char_p]
-        self.lib.load_dictionary.restype = c_int
-
-        self.lib.is_word_correct.argtypes = [c_char_p]
-        self.lib.is_word_correct.restype = c_int
-
-        self.lib.get_suggestions.argtypes = [c_char_p, c_int, POINTER(Suggestion)]
-        self.lib.get_suggestions.restype = c_int
-
-        self.lib.cleanup.argtypes = []
-        self.lib.cleanup.restype = None
+        except AttributeError as e:
+            # Built from an older SpellCheck.c that is missing a function this version calls
+            messagebox.showerror("Library Load Error", f"C library is out of date: {e}\n"
+                                                      f"Please rebuild '{os.path.basename(library_path)}' "
+                                                       "from the current Backend/SpellCheck.c.")
 
     def load_dictionary(self, filename):
         if self.lib is None:
-            print("C library not loaded, cannot load dictionary.")
+            log.debug("C library not loaded, cannot load dictionary.")
             return False
         
-        print(f"Calling C load_dictionary with: {filename}")
-        success = self.lib.load_dictionary(filename.encode('utf-8'))
-        self.loaded = bool(success)
-        print(f"Dictionary load success: {self.loaded}")
+        log.debug("Calling C load_dictionary with: %s", filename)
+        # Calls from the Tk thread check this first and return early instead of waiting on the parse
+        self.loaded = False
+        with self._lock.exclusive():
+            if self.lib is None:
+                return False
+            self._correct_cache.clear()
+            self._suggestions_cache.clear()
+            self.generation += 1
+            success = self.lib.load_dictionary(filename.encode('utf-8'))
+            self.loaded = bool(success)
+        log.debug("Dictionary load success: %s", self.loaded)
         return self.loaded
 
     def is_word_correct(self, word):
         if not self.loaded or self.lib is None:
             return False
-        return bool(self.lib.is_word_correct(word.encode('utf-8')))
+        # Cache lookups so repeated words skip the ctypes round-trip
+        cached = self._correct_cache.get(word)
+        if cached is None:
+            encoded = word.encode('utf-8')
+            with self._lock.shared():
+                if not self.loaded:
+                    return False
+                cached = (bool(self.lib.is_word_correct(encoded)), encoded)
+                self._correct_cache[word] = cached
+        return cached[0]
+
+    def _encoded(self, word):
+        """Return the UTF-8 bytes for word, reusing the cached copy when there is one"""
+        cached = self._correct_cache.get(word)
+        if cached is not None:
+            return cached[1]
+        return word.encode('utf-8')
 
-    def get_suggestions(self, word, tolerance=2):
+    def check_bulk(self, words):
+        """Check a list of words, sending all cache misses to C in a single call"""
         if not self.loaded or self.lib is None:
-            print(f"Skipping get_suggestions for '{word}': Library/dictionary not loaded.")
-            return []
+            return [False] * len(words)
 
-        suggestions_array = (Suggestion * 5)()
-        
-        print(f"Calling C get_suggestions for: '{word}' with tolerance {tolerance}")
-        num_found = self.lib.get_suggestions(word.encode('utf-8'), tolerance, suggestions_array)
-        print(f"C get_suggestions returned {num_found} results.")
+        # Collect flags into a local dict under the lock, a reload may clear the cache at any time
+        results = {}
+        with self._lock.shared():
+            if not self.loaded:
+                return [False] * len(words)
+            misses = []
+            for w in dict.fromkeys(words):
+                cached = self._correct_cache.get(w)
+                if cached is None:
+                    misses.append(w)
+                else:
+                    results[w] = cached[0]
+
+            if misses:
+                n = len(misses)
+                encoded = [w.encode('utf-8') for w in misses]
+                if n >= SHARD_MIN_WORDS and self._shard_pool is not None:
+                    flags = self._check_sharded(encoded)
+                elif self._fast:
+                    # Packed into a reusable C buffer inside the extension
+                    flags = self.lib.check_words_bulk(encoded)
+                elif self._bulk_lock.acquire(False):
+                    try:
+                        if len(self._bulk_flags) < n:
+                            self._bulk_flags = (c_int * n)()
+                        self.lib.check_words_bulk(b"\0".join(encoded), n, self._bulk_flags)
+                        flags = self._bulk_flags[:n]
+                    finally:
+                        self._bulk_lock.release()
+                else:
+                    flags = self._check_shard(encoded)
+                for i, w in enumerate(misses):
+                    correct = bool(flags[i])
+                    self._correct_cache[w] = (correct, encoded[i])
+                    results[w] = correct
+
+        return [results[w] for w in words]
+
+    def _check_sharded(self, encoded):
+        """Split a large bulk check across the shard pool, the caller must hold self._lock"""
+        step = -(-len(encoded) // self._shard_workers)
+        shards = [encoded[i:i + step] for i in range(0, len(encoded), step)]
+        flags = []
+        for shard_flags in self._shard_pool.map(self._check_shard, shards):
+            flags.extend(shard_flags)
+        return flags
+
+    def _check_shard(self, encoded):
+        """Bulk check one shard with its own buffers, safe to run on several threads at once"""
+        if self._fast:
+            return self.lib.check_words_bulk(encoded)
+        flags = (c_int * len(encoded))()
+        self.lib.check_words_bulk(b"\0".join(encoded), len(encoded), flags)
+        return flags
+
+    def get_suggestions(self, word, tolerance=DEFAULT_TOLERANCE, length_tolerance=2):
+        if not self.loaded or self.lib is None:
+            log.debug("Skipping get_suggestions for '%s': Library/dictionary not loaded.", word)
+            return [], []
+
+        cache_key = (word, tolerance, length_tolerance)
+        cached = self._suggestions_cache.get(cache_key)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+
+        encoded = self._encoded(word)
+        log.debug("Calling C get_suggestions for: '%s' with tolerance %d", word, tolerance)
+        with self._lock.shared():
+            if not self.loaded:
+                return [], []
+            if self._fast:
+                words, dists = self.lib.get_suggestions(encoded, tolerance, length_tolerance,
+                                                        MAX_SHOWN_SUGGESTIONS)
+            else:
+                shared = self._sug_lock.acquire(False)
+                try:
+                    if shared:
+                        suggestions_array = self._sug_buf
+                    else:
+                        suggestions_array = (Suggestion * MAX_TEMP_SUGGESTIONS_C)()
+                    num_found = self.lib.get_suggestions(encoded, tolerance, len(encoded),
+                                                         length_tolerance, suggestions_array)
 
-        python_suggestions = []
-        for i in range(num_found):
-            decoded_word = suggestions_array[i].word.decode('utf-8')
-            python_suggestions.append({
-                "word": decoded_word,
-                "dist": suggestions_array[i].dist
-            })
-            print(f"  Received C suggestion: {decoded_word} (dist: {suggestions_array[i].dist})")
-        return python_suggestions
+                    # Copy results out before the buffer can be reused
+                    words = []
+                    dists = []
+                    for i in range(min(num_found, MAX_SHOWN_SUGGESTIONS)):
+                        words.append(suggestions_array[i].word.decode('utf-8'))
+                        dists.append(suggestions_array[i].dist)
+                finally:
+                    if shared:
+                        self._sug_lock.release()
+            # Cached under the lock so a reload can't clear the cache first and leave stale entries
+            self._suggestions_cache[cache_key] = (words, dists)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("C get_suggestions returned %d results.", len(words))
+            for decoded_word, dist in zip(words, dists):
+                log.debug("  Received C suggestion: %s (dist: %d)", decoded_word, dist)
+        return list(words), list(dists)
 
     def cleanup(self):
+        # Never block the caller on a running check or load, the lock runs this once they finish
+        self.loaded = False
+        self._lock.run_exclusive_deferred(self._cleanup_now)
+
+    def _cleanup_now(self):
+        """Free the C dictionary, the caller must hold self._lock exclusively"""
         if self.lib:
-            print("Calling C cleanup function.")
+            log.debug("Calling C cleanup function.")
             self.lib.cleanup()
+        self._correct_cache.clear()
+        self._suggestions_cache.clear()
         self.loaded = False
         self.lib = None
+        if self._shard_pool is not None:
+            self._shard_pool.shutdown(wait=False)
+            self._shard_pool = None
 
 # --- MODERN TKINTER GUI APPLICATION ---
 
@@ -117,9 +402,8 @@ class SpellCheckerApp:
         self.main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Configure grid weights
-        self.main_container.grid_rowconfigure(2, weight=3)  # Input area
-        self.main_container.grid_rowconfigure(4, weight=4)  # Preview area
-        self.main_container.grid_rowconfigure(6, weight=2)  # Suggestions area
+        self.main_container.grid_rowconfigure(2, weight=7)  # Input area, errors are highlighted inline
+        self.main_container.grid_rowconfigure(4, weight=2)  # Suggestions area
         self.main_container.grid_columnconfigure(0, weight=2)
         self.main_container.grid_columnconfigure(1, weight=1)
         
@@ -141,16 +425,28 @@ class SpellCheckerApp:
         # Create the interface
         self.create_header()
         self.create_input_section()
-        self.create_preview_section()
+        self.create_stats_panel()
         self.create_suggestions_section()
         self.create_status_bar()
         
         # Initialize variables
-        self.current_incorrect_word_obj = None
+        self.current_error_range = None
         self.current_original_token = None
-        self.current_replacement_idx = -1
+        # Short words keep their stricter default until the user picks a distance
+        self._tolerance_touched = False
+        
+        # Spell checks run on a worker thread, results are polled from the Tk loop
+        self._check_seq = 0
+        self._last_checked_text = None
+        self._last_raw_text = None
+        self._check_queue = queue.Queue()
+        self._result_queue = queue.Queue()
+        self._check_thread = threading.Thread(target=self._check_worker, daemon=True)
+        self._check_thread.start()
+        self._drain_timer = master.after(50, self._drain_results)
         
         # Load library and dictionary
+        self._dict_mtime = None
         self._load_files_directly()
         master.protocol("WM_DELETE_WINDOW", self.on_closing)
         
@@ -261,62 +557,25 @@ class SpellCheckerApp:
             pady=15
         )
         self.sentence_text.pack(fill=tk.BOTH, expand=True)
+
+        # Misspellings are marked with tags on the input text itself
+        self.sentence_text.tag_configure("err",
+                                         font=('Segoe UI', 12, 'bold'),
+                                         foreground='white',
+                                         background=self.colors['error'])
+        self.sentence_text.tag_configure("sel_err", background=self.colors['secondary'])
+        self.sentence_text.tag_raise("sel")
+        self.sentence_text.tag_bind("err", "<Button-1>", self.on_error_click)
+        self.sentence_text.tag_bind("err", "<Enter>", lambda e: self.sentence_text.config(cursor="hand2"))
+        self.sentence_text.tag_bind("err", "<Leave>", lambda e: self.sentence_text.config(cursor="xterm"))
         self.sentence_text.bind("<KeyRelease>", self.on_text_change)
         self.sentence_text.bind("<FocusIn>", lambda e: self.animate_focus(input_container, True))
         self.sentence_text.bind("<FocusOut>", lambda e: self.animate_focus(input_container, False))
 
-    def create_preview_section(self):
-        """Create modern preview section"""
-        # Preview header
-        preview_label = tk.Label(self.main_container,
-                               text="👀 Live Preview:",
-                               font=('Segoe UI', 14, 'bold'),
-                               fg=self.colors['text_primary'],
-                               bg=self.colors['background'])
-        preview_label.grid(row=3, column=0, sticky='w', pady=(0, 10))
-        
-        # Stats panel
-        self.create_stats_panel()
-        
-        # Preview container
-        preview_container = tk.Frame(self.main_container,
-                                   bg=self.colors['surface'],
-                                   relief=tk.FLAT,
-                                   bd=2,
-                                   highlightbackground=self.colors['border'],
-                                   highlightthickness=2)
-        preview_container.grid(row=4, column=0, sticky='nsew', pady=(0, 20))
-        preview_container.grid_rowconfigure(0, weight=1)
-        preview_container.grid_columnconfigure(0, weight=1)
-        
-        # Canvas for scrollable content
-        self.preview_canvas = tk.Canvas(preview_container,
-                                      bg=self.colors['surface'],
-                                      highlightthickness=0)
-        self.preview_canvas.grid(row=0, column=0, sticky='nsew')
-        
-        # Scrollbar
-        preview_scrollbar = ttk.Scrollbar(preview_container,
-                                        orient=tk.VERTICAL,
-                                        command=self.preview_canvas.yview)
-        preview_scrollbar.grid(row=0, column=1, sticky='ns')
-        self.preview_canvas.configure(yscrollcommand=preview_scrollbar.set)
-        
-        # Inner frame for word labels
-        self.preview_inner_frame = tk.Frame(self.preview_canvas, bg=self.colors['surface'])
-        self.canvas_window = self.preview_canvas.create_window(
-            (0, 0), window=self.preview_inner_frame, anchor="nw"
-        )
-        
-        # Bind events
-        self.preview_canvas.bind('<Configure>', self.on_canvas_configure)
-        self.preview_inner_frame.bind('<Configure>', 
-            lambda e: self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all")))
-
     def create_stats_panel(self):
         """Create statistics panel"""
         stats_frame = tk.Frame(self.main_container, bg=self.colors['background'])
-        stats_frame.grid(row=3, column=1, sticky='new', padx=(20, 0), pady=(0, 10))
+        stats_frame.grid(row=2, column=1, sticky='new', padx=(20, 0), pady=(0, 10))
         
         # Stats cards
         self.create_stat_card(stats_frame, "Words", "0", self.colors['primary'], 0)
@@ -355,11 +614,11 @@ class SpellCheckerApp:
                                    font=('Segoe UI', 14, 'bold'),
                                    fg=self.colors['text_primary'],
                                    bg=self.colors['background'])
-        suggestions_label.grid(row=5, column=0, sticky='w', pady=(0, 10))
+        suggestions_label.grid(row=3, column=0, sticky='w', pady=(0, 10))
         
         # Suggestions container
         suggestions_container = tk.Frame(self.main_container, bg=self.colors['background'])
-        suggestions_container.grid(row=6, column=0, columnspan=2, sticky='nsew')
+        suggestions_container.grid(row=4, column=0, columnspan=2, sticky='nsew')
         suggestions_container.grid_rowconfigure(0, weight=1)
         suggestions_container.grid_columnconfigure(0, weight=2)
         suggestions_container.grid_columnconfigure(1, weight=1)
@@ -410,6 +669,31 @@ class SpellCheckerApp:
             state=tk.DISABLED
         )
         self.ignore_button.pack(fill=tk.X)
+        
+        # Edit distance used for suggestions, lower is faster and stricter
+        self.tolerance_var = tk.IntVar(value=DEFAULT_TOLERANCE)
+        self.tolerance_scale = tk.Scale(
+            actions_frame,
+            label="Max edit distance",
+            from_=1,
+            to=3,
+            orient=tk.HORIZONTAL,
+            variable=self.tolerance_var,
+            font=('Segoe UI', 10),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['background'],
+            highlightthickness=0,
+            bd=0,
+            command=self.on_tolerance_change
+        )
+        self.tolerance_scale.pack(fill=tk.X, pady=(10, 0))
+
+    def on_tolerance_change(self, value=None):
+        """Refresh suggestions for the selected word with the new tolerance"""
+        if self.tolerance_var.get() != DEFAULT_TOLERANCE:
+            self._tolerance_touched = True
+        if self.current_error_range is not None:
+            self.select_incorrect_word(*self.current_error_range)
 
     def create_status_bar(self):
         """Create modern status bar"""
@@ -441,14 +725,13 @@ class SpellCheckerApp:
 
     def on_text_change(self, event=None):
         """Handle text changes with live updates"""
-        text = self.sentence_text.get("1.0", tk.END).strip()
-        char_count = len(text)
+        # Read the widget once per keystroke and hand the result on to check_sentence
+        current = self._current_text()
+        char_count = len(current[0])
         self.char_counter.config(text=f"{char_count} characters")
         
-        # Debounced spell checking
-        if hasattr(self, '_check_timer'):
-            self.master.after_cancel(self._check_timer)
-        self._check_timer = self.master.after(300, self.check_sentence)
+        # Spell checking runs on the worker thread, stale requests are dropped there
+        self.check_sentence(current=current)
 
     def update_stats(self, word_count, error_count):
         """Update statistics display"""
@@ -480,29 +763,69 @@ class SpellCheckerApp:
         }
         self.status_indicator.config(bg=colors.get(status, self.colors['warning']))
 
-    def on_canvas_configure(self, event):
-        """Handle canvas resize"""
-        canvas_width = event.width
-        self.preview_canvas.itemconfig(self.canvas_window, width=canvas_width - 20)
-        self.check_sentence()
-
     def _load_files_directly(self):
         """Load C library and dictionary with better feedback"""
-        if self.c_spell_checker:
-            self.c_spell_checker.cleanup()
-            self.c_spell_checker = None
+        try:
+            dict_mtime = os.stat(self.DICT_PATH).st_mtime
+        except OSError:
+            dict_mtime = None
+
+        # Nothing to do if the dictionary file hasn't changed since it was loaded
+        if (self.c_spell_checker and self.c_spell_checker.loaded
+                and dict_mtime is not None and dict_mtime == self._dict_mtime):
+            self.status_text.config(text="✅ Ready - Dictionary unchanged")
+            self.update_status_indicator('ready')
+            self.check_sentence()
+            return
 
         self.status_text.config(text="🔄 Loading C Library and Dictionary...")
         self.update_status_indicator('checking')
         self.master.update_idletasks()
 
-        self.c_spell_checker = CSpellChecker(self.C_LIB_PATH)
+        if not self.c_spell_checker or self.c_spell_checker.lib is None:
+            self.c_spell_checker = CSpellChecker(self.C_LIB_PATH)
         if self.c_spell_checker.lib is None:
             self.status_text.config(text="❌ Error: C Library failed to load")
             self.update_status_indicator('error')
             return
 
-        if self.c_spell_checker.load_dictionary(self.DICT_PATH):
+        # Parse the dictionary on a background thread so the window keeps painting
+        self._dict_mtime = None
+        self.reload_btn.config(state=tk.DISABLED)
+        checker = self.c_spell_checker
+        load_result = queue.Queue(maxsize=1)
+        threading.Thread(target=self._load_dict_in_background, args=(checker, load_result),
+                         daemon=True).start()
+        self.master.after(50, self._poll_dict_load, checker, load_result, dict_mtime)
+
+    def _load_dict_in_background(self, checker, load_result):
+        """Parse the dictionary off the Tk thread, always reporting a result back"""
+        success = False
+        try:
+            success = checker.load_dictionary(self.DICT_PATH)
+        except Exception:
+            log.exception("Dictionary load failed")
+        finally:
+            load_result.put(success)
+
+    def _poll_dict_load(self, checker, load_result, dict_mtime):
+        """Wait for the background dictionary load without blocking the Tk loop"""
+        try:
+            success = load_result.get_nowait()
+        except queue.Empty:
+            self.master.after(50, self._poll_dict_load, checker, load_result, dict_mtime)
+            return
+        self._on_dict_loaded(checker, success, dict_mtime)
+
+    def _on_dict_loaded(self, checker, success, dict_mtime):
+        """Update the interface once the dictionary load has finished"""
+        self.reload_btn.config(state=tk.NORMAL)
+        if checker is not self.c_spell_checker:
+            return
+
+        if success:
+            self._dict_mtime = dict_mtime
+            self._last_checked_text = None  # Recheck everything against the new dictionary
             self.status_text.config(text="✅ Ready - Dictionary loaded successfully")
             self.update_status_indicator('ready')
             self.check_sentence()
@@ -513,123 +836,201 @@ class SpellCheckerApp:
                 self.c_spell_checker.cleanup()
             self.c_spell_checker = None
 
-    def check_sentence(self, event=None):
-        """Enhanced spell checking with better visual feedback"""
+    def _current_text(self):
+        """Return the stripped widget text, the (line, column) it starts at and the raw text"""
+        raw_text = self.sentence_text.get("1.0", tk.END)
+        leading = len(raw_text) - len(raw_text.lstrip())
+        return raw_text.strip(), _advance((1, 0), raw_text[:leading]), raw_text
+
+    def check_sentence(self, event=None, current=None):
+        """Queue the current text for spell checking, reusing a _current_text result if given"""
         if not self.c_spell_checker or not self.c_spell_checker.loaded:
-            self.clear_preview()
+            self._check_seq += 1
+            self._last_checked_text = None
+            self.clear_highlights()
             self.suggestions_listbox.delete(0, tk.END)
             self.manual_replace_button.config(state=tk.DISABLED)
             self.ignore_button.config(state=tk.DISABLED)
             self.reset_selection()
             return
 
-        current_sentence = self.sentence_text.get("1.0", tk.END).strip()
+        current_sentence, text_start, raw_text = current or self._current_text()
+
+        # Highlights move with the text in the widget, so unchanged text needs no new check
+        if current_sentence == self._last_checked_text:
+            if raw_text != self._last_raw_text or not self.sentence_text.edit_modified():
+                # Whitespace typed around the text, or no edit at all (arrows, modifiers)
+                self._last_raw_text = raw_text
+                return
+            # Edited back to exactly the checked text, e.g. a word pasted over itself. Tk doesn't
+            # carry highlights onto re-inserted text, so check again and let the render fix them
+        self._check_seq += 1
+        self._last_checked_text = current_sentence
+        self._last_raw_text = raw_text
         
         if not current_sentence:
-            self.clear_preview()
+            self.clear_highlights()
             self.update_stats(0, 0)
             return
-        
-        self.clear_preview()
-        self.suggestions_listbox.delete(0, tk.END)
-        self.manual_replace_button.config(state=tk.DISABLED)
-        self.ignore_button.config(state=tk.DISABLED)
-        self.reset_selection()
 
-        tokens = re.findall(r"(\w+|[^\w\s]+|\s+)", current_sentence)
-        self.all_tokens = tokens
-        
+        # Any edit after this point sets the flag again, which marks this check's result as stale
+        self.sentence_text.edit_modified(False)
+        self._check_queue.put((self._check_seq, current_sentence, text_start, self.c_spell_checker))
+
+    def _check_worker(self):
+        """Background loop that tokenizes and checks queued text"""
+        # Results of the previous check, so only the edited tokens go back to C
+        last_checker = None
+        last_generation = None
+        last_text_start = None
+        last_tokens = []
+        last_is_word = []
+        last_errors = []
+        last_spans = []
         word_count = 0
         error_count = 0
-        
-        # Create word labels with modern styling
-        for i, token in enumerate(tokens):
-            word_lower = token.lower()
-            is_error = False
-            
-            if word_lower.isalpha():
-                word_count += 1
-                if not self.c_spell_checker.is_word_correct(word_lower):
-                    is_error = True
-                    error_count += 1
-            
-            word_label = self.create_word_label(token, is_error, i)
-            word_label.pack(side=tk.LEFT, padx=1, pady=2)
+
+        while True:
+            job = self._check_queue.get()
+            # Only the most recent request matters, skip anything older
+            try:
+                while True:
+                    job = self._check_queue.get_nowait()
+            except queue.Empty:
+                pass
+            if job is None:
+                return
+
+            try:
+                seq, current_sentence, text_start, checker = job
+                tokens = _TOKEN_RE.findall(current_sentence)
+                generation = checker.generation
+                if checker is not last_checker or generation != last_generation:
+                    last_text_start = None
+                    last_tokens, last_is_word, last_errors, last_spans = [], [], [], []
+                    word_count = error_count = 0
+
+                start, old_end, new_end = _changed_span(last_tokens, tokens)
+                changed = tokens[start:new_end]
+                # Classify each token once, and only lowercase words that need it
+                is_word = []
+                words = []
+                for token in changed:
+                    alpha = token.isalpha()
+                    is_word.append(alpha)
+                    if alpha:
+                        words.append(token if token.islower() else token.lower())
+                flags = iter(checker.check_bulk(words))
+                if not checker.loaded:
+                    # A reload started mid-check, the flags are meaningless, recheck once it's done
+                    last_checker = None
+                    continue
+                changed_errors = [alpha and not next(flags) for alpha in is_word]
+
+                # Keep the stats in step using only the changed tokens
+                word_count += sum(is_word) - sum(last_is_word[start:old_end])
+                error_count += sum(changed_errors) - sum(last_errors[start:old_end])
+                is_word = last_is_word[:start] + is_word + last_is_word[old_end:]
+                errors = last_errors[:start] + changed_errors + last_errors[old_end:]
+
+                # Positions of the misspellings, only the ones in the changed window are walked
+                if text_start == last_text_start:
+                    n_before = sum(last_errors[:start])
+                    n_old = sum(last_errors[start:old_end])
+                    pos = _advance(text_start, "".join(tokens[:start]))
+                    window_spans, new_end_pos = _error_spans(pos, changed, changed_errors)
+                    old_end_pos = _advance(pos, "".join(last_tokens[start:old_end]))
+                    # Spans after the window move down by the same lines, and along if on its last line
+                    line_shift = new_end_pos[0] - old_end_pos[0]
+                    col_shift = new_end_pos[1] - old_end_pos[1]
+                    shifted = []
+                    for line, col, end_col in last_spans[n_before + n_old:]:
+                        if line == old_end_pos[0]:
+                            shifted.append((line + line_shift, col + col_shift, end_col + col_shift))
+                        else:
+                            shifted.append((line + line_shift, col, end_col))
+                    spans = last_spans[:n_before] + window_spans + shifted
+                else:
+                    spans, _ = _error_spans(text_start, tokens, errors)
+
+                # "line.column" index pairs of the misspelled tokens inside the text widget
+                error_spans = []
+                for line, col, end_col in spans:
+                    error_spans += ("%d.%d" % (line, col), "%d.%d" % (line, end_col))
+
+                last_checker, last_generation, last_text_start = checker, generation, text_start
+                last_tokens, last_is_word, last_errors, last_spans = tokens, is_word, errors, spans
+                self._result_queue.put((seq, error_spans, word_count, error_count))
+            except Exception:
+                # One failed job must not stop checking for the rest of the session
+                log.exception("Spell check failed")
+                last_checker = None
+
+    def _drain_results(self):
+        """Render the latest finished check, dropping stale results"""
+        latest = None
+        try:
+            while True:
+                latest = self._result_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        if latest is not None and latest[0] == self._check_seq:
+            if not self.sentence_text.edit_modified():
+                self._render_check_result(*latest[1:])
+            else:
+                # The text changed before its key release queued a new check, the spans no longer fit
+                self._last_checked_text = None
+                self.check_sentence()
+
+        self._drain_timer = self.master.after(50, self._drain_results)
+
+    def _render_check_result(self, error_spans, word_count, error_count):
+        """Enhanced spell checking with better visual feedback"""
+        self.reset_selection()
+
+        # Tk moved the existing highlights along with the edits, so only touch ranges that differ
+        on_screen = [str(index) for index in self.sentence_text.tag_ranges("err")]
+        shown = set(zip(on_screen[::2], on_screen[1::2]))
+        wanted = set(zip(error_spans[::2], error_spans[1::2]))
+        stale = [index for span in shown - wanted for index in span]
+        if stale:
+            # Text.tag_remove only takes one range, Tk itself accepts any number
+            self.sentence_text.tk.call(self.sentence_text._w, "tag", "remove", "err", *stale)
+        fresh = [index for span in wanted - shown for index in span]
+        if fresh:
+            self.sentence_text.tag_add("err", *fresh)
         
         # Update statistics
         self.update_stats(word_count, error_count)
         
-        # Update canvas scroll region
-        self.preview_inner_frame.update_idletasks()
-        self.preview_canvas.config(scrollregion=self.preview_canvas.bbox("all"))
-        
         if error_count > 0:
             self.status_text.config(text=f"📝 Found {error_count} potential error{'s' if error_count != 1 else ''}")
         else:
             self.status_text.config(text="✨ Perfect! No spelling errors found")
 
-    def create_word_label(self, token, is_error, index):
-        """Create styled word label"""
-        if is_error:
-            label = tk.Label(self.preview_inner_frame,
-                           text=token,
-                           font=('Segoe UI', 12, 'bold'),
-                           fg='white',
-                           bg=self.colors['error'],
-                           padx=6,
-                           pady=2,
-                           cursor="hand2",
-                           relief=tk.FLAT)
-            label.bind("<Button-1>", lambda e: self.select_incorrect_word(label, token, index))
-            label.bind("<Enter>", lambda e: label.config(bg='#DC2626'))  # Darker red on hover
-            label.bind("<Leave>", lambda e: self.on_word_leave(label))
-        else:
-            label = tk.Label(self.preview_inner_frame,
-                           text=token,
-                           font=('Segoe UI', 12),
-                           fg=self.colors['text_primary'],
-                           bg=self.colors['surface'])
-        
-        return label
+    def clear_highlights(self):
+        """Remove all misspelling highlights"""
+        self.reset_selection()
+        self.sentence_text.tag_remove("err", "1.0", tk.END)
 
-    def on_word_leave(self, label):
-        """Handle mouse leave on error word"""
-        try:
-            # Check if widget still exists before configuring
-            if label.winfo_exists():
-                if label == self.current_incorrect_word_obj:
-                    label.config(bg=self.colors['secondary'])  # Keep selected color
-                else:
-                    label.config(bg=self.colors['error'])  # Return to error color
-        except tk.TclError:
-            # Widget has been destroyed, ignore the error
-            pass
+    def on_error_click(self, event):
+        """Handle click on a highlighted word"""
+        index = self.sentence_text.index(f"@{event.x},{event.y}")
+        error_range = self.sentence_text.tag_prevrange("err", f"{index}+1c")
+        if error_range and self.sentence_text.compare(index, "<", error_range[1]):
+            self.select_incorrect_word(*error_range)
 
-    def clear_preview(self):
-        """Clear preview area"""
-        # Reset selection before destroying widgets to avoid invalid widget references
-        if self.current_incorrect_word_obj:
-            self.current_incorrect_word_obj = None
-            self.current_original_token = None
-            self.current_replacement_idx = -1
-        
-        for widget in self.preview_inner_frame.winfo_children():
-            widget.destroy()
-
-    def select_incorrect_word(self, word_label_obj, original_token, index_in_tokens):
+    def select_incorrect_word(self, start, end):
         """Select incorrect word with modern styling"""
-        print(f"\n--- select_incorrect_word called ---")
-        print(f"  Selected word: '{original_token}' (Index: {index_in_tokens})")
-
-        # Reset previous selection
-        if self.current_incorrect_word_obj:
-            self.current_incorrect_word_obj.config(bg=self.colors['error'])
+        original_token = self.sentence_text.get(start, end)
+        log.debug("select_incorrect_word: '%s' (%s - %s)", original_token, start, end)
 
-        # Set new selection
-        self.current_incorrect_word_obj = word_label_obj
+        # Move the selection highlight to the new word
+        self.sentence_text.tag_remove("sel_err", "1.0", tk.END)
+        self.sentence_text.tag_add("sel_err", start, end)
+        self.current_error_range = (start, end)
         self.current_original_token = original_token
-        self.current_replacement_idx = index_in_tokens
-        self.current_incorrect_word_obj.config(bg=self.colors['secondary'])
 
         # Enable action buttons
         self.manual_replace_button.config(state=tk.NORMAL)
@@ -638,22 +1039,25 @@ class SpellCheckerApp:
         # Get and display suggestions
         self.suggestions_listbox.delete(0, tk.END)
         word_for_suggestions = original_token.lower()
-        suggestions = self.c_spell_checker.get_suggestions(word_for_suggestions)
+        tolerance = self.tolerance_var.get()
+        if len(word_for_suggestions) <= SHORT_WORD_LEN and not self._tolerance_touched:
+            tolerance = 1
+        words, dists = self.c_spell_checker.get_suggestions(word_for_suggestions, tolerance)
 
-        if suggestions:
-            for sug in suggestions:
-                display_text = f"{sug['word']}"
-                if sug['dist'] > 0:
-                    display_text += f" (similarity: {max(0, 100-sug['dist']*10)}%)"
+        if words:
+            for word, dist in zip(words, dists):
+                display_text = word
+                if dist > 0:
+                    display_text += f" (similarity: {max(0, 100-dist*10)}%)"
                 self.suggestions_listbox.insert(tk.END, display_text)
-            self.status_text.config(text=f"💡 {len(suggestions)} suggestion{'s' if len(suggestions) != 1 else ''} for '{original_token}'")
+            self.status_text.config(text=f"💡 {len(words)} suggestion{'s' if len(words) != 1 else ''} for '{original_token}'")
         else:
             self.suggestions_listbox.insert(tk.END, "No suggestions found")
             self.status_text.config(text=f"🔍 No suggestions found for '{original_token}'")
 
     def apply_suggestion(self, event=None):
         """Apply selected suggestion"""
-        if self.current_replacement_idx == -1:
+        if self.current_error_range is None:
             return
 
         selected_indices = self.suggestions_listbox.curselection()
@@ -671,7 +1075,7 @@ class SpellCheckerApp:
 
     def manual_replace_word(self):
         """Handle manual word replacement"""
-        if self.current_replacement_idx == -1:
+        if self.current_error_range is None:
             messagebox.showwarning("No Selection", "Please select a word to replace first.")
             return
 
@@ -687,17 +1091,20 @@ class SpellCheckerApp:
 
     def _replace_selected_word(self, replacement_word):
         """Replace selected word and refresh display"""
-        if self.current_replacement_idx == -1:
+        if self.current_error_range is None:
             return
 
-        self.all_tokens[self.current_replacement_idx] = replacement_word
-        new_sentence = "".join(self.all_tokens)
+        # The text may have been edited since the word was highlighted
+        start, end = self.current_error_range
+        if self.sentence_text.get(start, end) != self.current_original_token:
+            self.reset_selection()
+            self.check_sentence()
+            return
 
-        # Update text widget
-        self.sentence_text.delete("1.0", tk.END)
-        self.sentence_text.insert("1.0", new_sentence)
+        # Swap just that range in the text widget, which is the only copy of the text
+        self.sentence_text.replace(start, end, replacement_word)
 
-        # Refresh spell checking
+        # Refresh spell checking, the worker only rechecks the replaced token
         self.check_sentence()
         self.status_text.config(text=f"✅ Replaced with '{replacement_word}' - Rechecking...")
 
@@ -710,29 +1117,21 @@ class SpellCheckerApp:
         self.manual_replace_button.config(state=tk.DISABLED)
         self.ignore_button.config(state=tk.DISABLED)
         
-        # Safely reset the current selection
-        if self.current_incorrect_word_obj:
-            try:
-                # Check if the widget still exists before trying to configure it
-                if self.current_incorrect_word_obj.winfo_exists():
-                    self.current_incorrect_word_obj.config(bg=self.colors['error'])
-            except tk.TclError:
-                # Widget has been destroyed, ignore the error
-                pass
-            finally:
-                self.current_incorrect_word_obj = None
-            
+        self.sentence_text.tag_remove("sel_err", "1.0", tk.END)
+        self.current_error_range = None
         self.current_original_token = None
-        self.current_replacement_idx = -1
 
     def on_closing(self):
         """Handle application closing"""
+        self._check_queue.put(None)
+        self.master.after_cancel(self._drain_timer)
         if self.c_spell_checker:
             self.c_spell_checker.cleanup()
         self.master.destroy()
 
 # --- MAIN EXECUTION ---
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     root = tk.Tk()
     
     # Set window icon and additional properties
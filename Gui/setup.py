@@ -0,0 +1,21 @@
+"""Build the optional Cython extension: python setup.py build_ext --inplace"""
+import os
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+here = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.join(here, '..', 'Backend')
+
+extension = Extension(
+    "spellcheckfunc_cy",
+    sources=[os.path.join(here, "spellcheckfunc_cy.pyx"),
+             os.path.join(backend_dir, "SpellCheck.c")],
+    include_dirs=[backend_dir],
+    define_macros=[("SPELLCHECK_NO_MAIN", None)],
+)
+
+setup(
+    name="spellcheckfunc_cy",
+    ext_modules=cythonize([extension], language_level=3),
+)
@@ -0,0 +1,150 @@
+# cython: language_level=3
+"""Cython bindings for the C spell checking backend.
+
+Used by ``main.py`` in place of the ctypes wrapper when it has been built, since
+calls skip ctypes' per-call argument conversion. Build it from this directory with
+``python setup.py build_ext --inplace``.
+
+The C calls run without the GIL. Lookups only read the dictionary, so
+``is_word_correct``, ``check_words_bulk`` and ``get_suggestions`` may run from
+several threads at once, but never alongside ``load_dictionary`` or ``cleanup``.
+"""
+
+import threading
+
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memcpy
+
+cdef extern from "SpellCheck.h" nogil:
+    enum: MAX_WORD_LEN
+    enum: MAX_TEMP_SUGGESTIONS
+
+    ctypedef struct Suggestion:
+        char word[MAX_WORD_LEN]
+        int dist
+
+    int c_load_dictionary "load_dictionary"(const char* filename)
+    int c_is_word_correct "is_word_correct"(const char* word)
+    int c_check_words_bulk "check_words_bulk"(const char* words, int count, int* flags)
+    int c_get_suggestions "get_suggestions"(const char* word, int tolerance, int misspelled_word_len,
+                                            int length_tolerance, Suggestion* suggestions)
+    void c_cleanup "cleanup"()
+
+# Buffers for check_words_bulk, they only ever grow so steady typing allocates nothing.
+# A call that finds them busy (another thread is mid-check) uses temporary ones instead
+cdef char* _words_buf = NULL
+cdef Py_ssize_t _words_cap = 0
+cdef int* _flags_buf = NULL
+cdef Py_ssize_t _flags_cap = 0
+_buffers_lock = threading.Lock()
+
+
+def load_dictionary(bytes filename):
+    cdef const char* path = filename
+    cdef int result
+    with nogil:
+        result = c_load_dictionary(path)
+    return result
+
+
+def is_word_correct(bytes word):
+    cdef const char* w = word
+    cdef int result
+    with nogil:
+        result = c_is_word_correct(w)
+    return result
+
+
+cdef int _grow_shared_buffers(Py_ssize_t total, Py_ssize_t count) except -1:
+    global _words_buf, _words_cap, _flags_buf, _flags_cap
+    cdef void* grown
+    if total > _words_cap:
+        grown = realloc(_words_buf, total)
+        if grown == NULL:
+            raise MemoryError()
+        _words_buf = <char*>grown
+        _words_cap = total
+    if count > _flags_cap:
+        grown = realloc(_flags_buf, count * sizeof(int))
+        if grown == NULL:
+            raise MemoryError()
+        _flags_buf = <int*>grown
+        _flags_cap = count
+    return 0
+
+
+def check_words_bulk(list words):
+    """Check a list of UTF-8 encoded words, returning a list of 1/0 flags"""
+    cdef Py_ssize_t count = len(words)
+    cdef Py_ssize_t total = 0
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t size
+    cdef Py_ssize_t i
+    cdef bytes word
+    cdef char* words_buf
+    cdef int* flags_buf
+
+    for word in words:
+        total += len(word) + 1
+
+    shared = _buffers_lock.acquire(False)
+    try:
+        if shared:
+            _grow_shared_buffers(total, count)
+            words_buf = _words_buf
+            flags_buf = _flags_buf
+        else:
+            words_buf = <char*>malloc(total)
+            flags_buf = <int*>malloc(count * sizeof(int))
+            if words_buf == NULL or flags_buf == NULL:
+                free(words_buf)
+                free(flags_buf)
+                raise MemoryError()
+
+        try:
+            # Copy the words in back to back, each null-terminated
+            for word in words:
+                size = len(word)
+                memcpy(words_buf + pos, <const char*>word, size)
+                words_buf[pos + size] = 0
+                pos += size + 1
+
+            with nogil:
+                c_check_words_bulk(words_buf, <int>count, flags_buf)
+            return [flags_buf[i] for i in range(count)]
+        finally:
+            if not shared:
+                free(words_buf)
+                free(flags_buf)
+    finally:
+        if shared:
+            _buffers_lock.release()
+
+
+def get_suggestions(bytes word, int tolerance, int length_tolerance, int max_results):
+    """Return up to ``max_results`` suggestions as (words, dists) lists"""
+    cdef const char* w = word
+    cdef int word_len = len(word)
+    cdef int num_found
+    cdef int i
+    # C may fill up to MAX_TEMP_SUGGESTIONS entries, each call gets its own buffer so
+    # concurrent callers never share one
+    cdef Suggestion* suggestions = <Suggestion*>malloc(MAX_TEMP_SUGGESTIONS * sizeof(Suggestion))
+    if suggestions == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            num_found = c_get_suggestions(w, tolerance, word_len, length_tolerance, suggestions)
+        words = []
+        dists = []
+        for i in range(min(num_found, max_results)):
+            words.append(suggestions[i].word.decode('utf-8'))
+            dists.append(suggestions[i].dist)
+        return words, dists
+    finally:
+        free(suggestions)
+
+
+def cleanup():
+    with nogil:
+        c_cleanup()